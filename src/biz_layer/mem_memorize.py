@@ -1361,26 +1361,19 @@ async def memorize(request: MemorizeRequest) -> int:
     else:
         logger.info(f"[mem_memorize] Successfully extracted MemCell")
         # Judged as boundary, mark all accumulated data as used (restart accumulation)
-        # Exclude current request's new messages so they can start the next accumulation
+        # Current request's new messages are confirmed to start the next accumulation
         try:
-            new_message_ids = [
-                r.data_id for r in request.new_raw_data_list if r.data_id
-            ]
-            delete_success = await conversation_data_repo.delete_conversation_data(
-                request.group_id, exclude_message_ids=new_message_ids
+            restart_success = await conversation_data_repo.restart_conversation_data(
+                request.new_raw_data_list, request.group_id
             )
-            if delete_success:
+            if restart_success:
                 logger.info(
-                    f"[mem_memorize] Judged as boundary, history marked as used (excluded {len(new_message_ids)} new): group_id={request.group_id}"
+                    f"[mem_memorize] Judged as boundary, history marked as used (excluded {len(request.new_raw_data_list)} new): group_id={request.group_id}"
                 )
             else:
                 logger.warning(
                     f"[mem_memorize] Failed to clear conversation history: group_id={request.group_id}"
                 )
-            # Confirm new messages to start the next accumulation cycle
-            await conversation_data_repo.save_conversation_data(
-                request.new_raw_data_list, request.group_id
-            )
         except Exception as e:
             logger.error(
                 f"[mem_memorize] Exception while marking conversation history: {e}"
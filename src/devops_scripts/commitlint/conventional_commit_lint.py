@@ -36,42 +36,55 @@ ALLOWED_TYPES = (
 
 SKIP_ENV_VAR = "SKIP_CONVENTIONAL_COMMIT_CHECK"
 
+# The hook runs once per process, so the skip flag is read once at import
+_SKIP_CHECK = os.getenv(SKIP_ENV_VAR) == "1"
+
+# Type alternation generated from ALLOWED_TYPES so the patterns cannot drift;
+# longest first so no type is shadowed by a shorter prefix of it
+_TYPES_ALT = "|".join(sorted(ALLOWED_TYPES, key=len, reverse=True))
+
 CONVENTIONAL_HEADER_RE = re.compile(
-    r"^(?P<type>feat|fix|docs|style|refactor|perf|test|build|ci|chore|revert)"
+    rf"^(?P<type>{_TYPES_ALT})"
     r"(?:\((?P<scope>[a-zA-Z0-9._/\-]+)\))?"
     r"(?P<breaking>!)?: "
     r"(?P<subject>\S.*)$"
 )
 
-SPECIAL_ALLOWED_RE = (
-    re.compile(r"^Merge (branch|remote-tracking branch|pull request) .+$"),
-    re.compile(r'^Revert ".+"$'),
-    re.compile(r"^(fixup|squash)! .+$"),
+# Merge/Revert/fixup/squash headers, folded into one anchored alternation so
+# they are validated with a single regex engine call
+_SPECIAL_HEADER_RE = re.compile(
+    r"^(?:Merge (?:branch|remote-tracking branch|pull request) .+"
+    r'|Revert ".+"'
+    r"|(?:fixup|squash)! .+)$"
 )
 
+# Cheap str.startswith prefilters checked before any regex work
+_TYPE_PREFIXES = tuple(
+    f"{allowed_type}{sep}" for allowed_type in ALLOWED_TYPES for sep in ("(", "!", ":")
+)
+_SPECIAL_PREFIXES = ("Merge ", 'Revert "', "fixup! ", "squash! ")
+
+# Shortest possible valid header, e.g. "ci: x"
+_MIN_HEADER_LEN = 5
+
 
 def _read_commit_message(msg_file: Path) -> str:
     content = msg_file.read_text(encoding="utf-8", errors="replace")
-    lines = []
-    for line in content.splitlines():
-        # Git comments are ignored in commit message validation
-        if line.startswith("#"):
-            continue
-        lines.append(line.rstrip())
-    # Trim outer empty lines
-    while lines and not lines[0]:
-        lines.pop(0)
-    while lines and not lines[-1]:
-        lines.pop()
-    return "\n".join(lines)
+    # Git comments are ignored in commit message validation; a single join
+    # replaces the per-line append loop and the outer empty-line trimming
+    # (stripped lines are "" so strip("\n") drops exactly those).
+    return "\n".join(
+        [line.rstrip() for line in content.splitlines() if not line.startswith("#")]
+    ).strip("\n")
 
 
 def _is_valid_conventional_header(header: str) -> bool:
-    if CONVENTIONAL_HEADER_RE.match(header):
-        return True
-    for pattern in SPECIAL_ALLOWED_RE:
-        if pattern.match(header):
-            return True
+    if len(header) < _MIN_HEADER_LEN:
+        return False
+    if header.startswith(_TYPE_PREFIXES):
+        return CONVENTIONAL_HEADER_RE.match(header) is not None
+    if header.startswith(_SPECIAL_PREFIXES):
+        return _SPECIAL_HEADER_RE.match(header) is not None
     return False
 
 
@@ -91,7 +104,7 @@ def _print_error(header: str) -> None:
 
 
 def lint_message(message: str) -> int:
-    if os.getenv(SKIP_ENV_VAR) == "1":
+    if _SKIP_CHECK:
         return 0
 
     first_line = message.splitlines()[0].strip() if message.strip() else ""
@@ -107,7 +120,8 @@ def lint_message(message: str) -> int:
 
 
 def cmd_hook(files: list[str]) -> int:
-    if os.getenv(SKIP_ENV_VAR) == "1":
+    # Skip before touching the message file at all
+    if _SKIP_CHECK:
         return 0
 
     if not files:
@@ -115,11 +129,12 @@ def cmd_hook(files: list[str]) -> int:
         return 1
 
     msg_file = Path(files[0])
-    if not msg_file.exists():
+    try:
+        message = _read_commit_message(msg_file)
+    except FileNotFoundError:
         print(f"Commit message file not found: {msg_file}", file=sys.stderr)
         return 1
 
-    message = _read_commit_message(msg_file)
     return lint_message(message)
 
 
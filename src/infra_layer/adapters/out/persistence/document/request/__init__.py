@@ -5,6 +5,7 @@ Request related document models
 
 from infra_layer.adapters.out.persistence.document.request.memory_request_log import (
     MemoryRequestLog,
+    MemoryRequestLogProjection,
 )
 
-__all__ = ["MemoryRequestLog"]
+__all__ = ["MemoryRequestLog", "MemoryRequestLogProjection"]
@@ -12,6 +12,15 @@ from core.oxm.mongo.document_base import DocumentBase
 from core.oxm.mongo.audit_base import AuditBase
 from pydantic import Field, ConfigDict
 from pymongo import IndexModel, ASCENDING, DESCENDING
+from beanie import PydanticObjectId
+
+# Retention of used (sync_status=1) records. Until then they are still returned
+# by reads that do not filter them out (by request_id, by user_id, or with
+# sync_status 1); afterwards the used_at TTL index deletes them.
+# Beanie creates the declared indexes on every startup and MongoDB rejects an
+# existing index with different options, so changing this value also needs a
+# migration that applies it to used_at_1 with collMod.
+_USED_LOG_TTL_SECONDS = 7 * 24 * 3600
 
 
 class MemoryRequestLog(DocumentBase, AuditBase):
@@ -53,7 +62,11 @@ class MemoryRequestLog(DocumentBase, AuditBase):
     raw_input: Optional[Dict[str, Any]] = Field(
         default=None, description="Raw input data (parsed JSON body)"
     )
-    raw_input_str: Optional[str] = Field(default=None, description="Raw input string")
+    # Deprecated: duplicated raw_input as a JSON string, no longer written.
+    # Kept only so that records written by older versions can still be read.
+    raw_input_str: Optional[str] = Field(
+        default=None, description="Raw input string (deprecated, legacy records only)"
+    )
 
     # Request metadata
     version: Optional[str] = Field(default=None, description="Code version")
@@ -73,6 +86,12 @@ class MemoryRequestLog(DocumentBase, AuditBase):
         description="Sync status: -1=log record, 0=window accumulating, 1=already used",
     )
 
+    # Set by the server when the record is marked as used (sync_status=1),
+    # used records expire _USED_LOG_TTL_SECONDS later via a TTL index
+    used_at: Optional[datetime] = Field(
+        default=None, description="Time the record was marked as used"
+    )
+
     model_config = ConfigDict(
         collection="memory_request_logs",
         validate_assignment=True,
@@ -106,14 +125,32 @@ class MemoryRequestLog(DocumentBase, AuditBase):
         indexes = [
             IndexModel([("group_id", ASCENDING), ("created_at", DESCENDING)]),
             IndexModel([("request_id", ASCENDING)]),
-            IndexModel([("user_id", ASCENDING)]),
-            IndexModel([("created_at", DESCENDING)]),
+            # Serves find_by_user_id (newest first) without an in-memory sort,
+            # its user_id prefix replaces the former single-field index.
+            # _id matches the (created_at, _id) sort of find_pending_by_filters
+            IndexModel(
+                [
+                    ("user_id", ASCENDING),
+                    ("created_at", DESCENDING),
+                    ("_id", DESCENDING),
+                ]
+            ),
+            IndexModel([("created_at", DESCENDING), ("_id", DESCENDING)]),
             IndexModel([("event_id", ASCENDING)]),
             IndexModel([("message_id", ASCENDING)]),
-            IndexModel([("group_id", ASCENDING), ("message_create_time", DESCENDING)]),
             # Composite index: used for batch updates and querying by status
             # Supports operations like update_many({"group_id": "xxx", "sync_status": -1}, ...)
-            IndexModel([("group_id", ASCENDING), ("sync_status", ASCENDING)]),
+            # and time-ranged window reads sorted by (created_at, _id), where _id
+            # breaks created_at ties for keyset pagination
+            # (its (group_id, sync_status) prefix replaces the former two-field index)
+            IndexModel(
+                [
+                    ("group_id", ASCENDING),
+                    ("sync_status", ASCENDING),
+                    ("created_at", DESCENDING),
+                    ("_id", DESCENDING),
+                ]
+            ),
             IndexModel(
                 [
                     ("group_id", ASCENDING),
@@ -121,4 +158,57 @@ class MemoryRequestLog(DocumentBase, AuditBase):
                     ("sync_status", ASCENDING),
                 ]
             ),
+            # TTL: used records are deleted by the server once expired
+            IndexModel(
+                [("used_at", ASCENDING)],
+                expireAfterSeconds=_USED_LOG_TTL_SECONDS,
+                partialFilterExpression={"sync_status": 1},
+            ),
         ]
+
+
+class MemoryRequestLogProjection(DocumentBase, AuditBase):
+    """
+    Simplified memory request log model (message fields only)
+
+    Contains only the fields needed to rebuild RawData, used by conversation data
+    reads to avoid transferring request metadata (url, endpoint, version, etc.).
+
+    raw_input is deliberately kept: it is the preferred source when the mapper
+    rebuilds RawData, so dropping it would lose fields not stored as columns.
+    """
+
+    id: Optional[PydanticObjectId] = Field(default=None, description="Record ID")
+    group_id: Optional[str] = Field(default=None, description="Conversation group ID")
+    request_id: Optional[str] = Field(default=None, description="Request ID")
+
+    # Message core fields
+    message_id: Optional[str] = Field(default=None, description="Message ID")
+    message_create_time: Optional[str] = Field(
+        default=None, description="Message creation time (ISO 8601 format)"
+    )
+    sender: Optional[str] = Field(default=None, description="Sender ID")
+    sender_name: Optional[str] = Field(default=None, description="Sender name")
+    role: Optional[str] = Field(default=None, description="Message sender role")
+    content: Optional[str] = Field(default=None, description="Message content")
+    group_name: Optional[str] = Field(default=None, description="Group name")
+    refer_list: Optional[List[str]] = Field(
+        default=None, description="List of referenced message IDs"
+    )
+
+    # Raw input (preferred source when rebuilding RawData)
+    raw_input: Optional[Dict[str, Any]] = Field(
+        default=None, description="Raw input data (parsed JSON body)"
+    )
+    raw_input_str: Optional[str] = Field(
+        default=None, description="Raw input string (deprecated, legacy records only)"
+    )
+
+    # Read-only model: skip per-assignment validation, values are validated once on load
+    model_config = ConfigDict(
+        validate_assignment=False, json_encoders={datetime: lambda dt: dt.isoformat()}
+    )
+
+
+# Export models
+__all__ = ["MemoryRequestLog", "MemoryRequestLogProjection"]
@@ -5,8 +5,8 @@ MemoryRequestLog <-> RawData Converter
 Handles bidirectional conversion between MemoryRequestLog and RawData.
 """
 
-import json
-from typing import Optional, List, Dict, Any
+from datetime import datetime
+from typing import Optional, List, Dict, Any, Union
 
 from core.observation.logger import get_logger
 from common_utils.datetime_utils import from_iso_format
@@ -18,10 +18,23 @@ from api_specs.request_converter import (
 )
 from infra_layer.adapters.out.persistence.document.request.memory_request_log import (
     MemoryRequestLog,
+    MemoryRequestLogProjection,
 )
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional, fall back to the stdlib parser
+    from json import loads as _json_loads
+
 logger = get_logger(__name__)
 
+_UTC = ZoneInfo("UTC")
+
+# Shortest JSON object that yields a message: both keys present with truthy
+# values, whose shortest JSON form is one character (e.g. 1). Whitespace or
+# escapes only make it longer, so shorter payloads skip the JSON parse.
+_MIN_RAW_INPUT_STR_LEN = len('{"sender":1,"message_id":1}')
+
 
 class MemoryRequestLogMapper:
     """
@@ -31,17 +44,25 @@ class MemoryRequestLogMapper:
     """
 
     @staticmethod
-    def to_raw_data(log: MemoryRequestLog) -> Optional[RawData]:
+    def to_raw_data(
+        log: Union[MemoryRequestLog, MemoryRequestLogProjection],
+        ts_cache: Optional[Dict[str, datetime]] = None,
+        str_cache: Optional[Dict[str, str]] = None,
+    ) -> Optional[RawData]:
         """
         Convert MemoryRequestLog to RawData
 
         Conversion strategy (by priority):
-        1. First, parse simple message format from raw_input_str
-        2. Then, parse simple message format from raw_input dictionary
+        1. First, parse simple message format from raw_input dictionary
+        2. Then, parse simple message format from raw_input_str, only for
+           legacy records without a raw_input dictionary (both are written
+           from the same body, so re-parsing the string would be wasted work)
         3. Finally, build from individual fields
 
         Args:
-            log: MemoryRequestLog object
+            log: MemoryRequestLog (or MemoryRequestLogProjection) object
+            ts_cache: Optional cache of parsed timestamps, shared across a batch
+            str_cache: Optional cache of repeated strings, shared across a batch
 
         Returns:
             RawData object or None (if conversion fails)
@@ -49,34 +70,84 @@ class MemoryRequestLogMapper:
         if log is None:
             return None
 
-        # Strategy 1: First, parse simple message format from raw_input_str
-        if log.raw_input_str:
+        # Strategy 1: Use raw_input dictionary to parse simple message format
+        if isinstance(log.raw_input, dict):
+            raw_data = MemoryRequestLogMapper._convert_simple_message_to_raw_data(
+                log.raw_input, log.request_id, ts_cache, str_cache
+            )
+            if raw_data:
+                return raw_data
+
+        # Strategy 2: Parse simple message format from raw_input_str (legacy)
+        elif log.raw_input_str and len(log.raw_input_str) >= _MIN_RAW_INPUT_STR_LEN:
             try:
-                data = json.loads(log.raw_input_str)
+                data = _json_loads(log.raw_input_str)
                 raw_data = MemoryRequestLogMapper._convert_simple_message_to_raw_data(
-                    data, log.request_id
+                    data, log.request_id, ts_cache, str_cache
                 )
                 if raw_data:
                     return raw_data
-            except (json.JSONDecodeError, ValueError, TypeError) as e:
+            except (ValueError, TypeError) as e:
                 logger.debug(
                     "Failed to parse from raw_input_str, trying other methods: %s", e
                 )
 
-        # Strategy 2: Use raw_input dictionary to parse simple message format
-        if log.raw_input:
-            raw_data = MemoryRequestLogMapper._convert_simple_message_to_raw_data(
-                log.raw_input, log.request_id
-            )
-            if raw_data:
-                return raw_data
-
         # Strategy 3: Build from individual fields
-        return MemoryRequestLogMapper._build_from_fields(log)
+        return MemoryRequestLogMapper._build_from_fields(log, ts_cache, str_cache)
+
+    @staticmethod
+    def _dedup_str(value: Any, str_cache: Optional[Dict[str, str]] = None) -> Any:
+        """
+        Return the batch-shared instance of a repeated string
+
+        group_id, sender, group_name etc. take only a few distinct values per
+        batch; sharing one instance lets the per-record copies decoded from BSON
+        be freed. A per-batch dict is used instead of sys.intern, whose entries
+        would live for the whole process.
+
+        Args:
+            value: String value (non-string values are returned unchanged)
+            str_cache: Optional cache of repeated strings
+
+        Returns:
+            Shared string instance or the original value
+        """
+        if str_cache is None or type(value) is not str:
+            return value
+        return str_cache.setdefault(value, value)
+
+    @staticmethod
+    def _parse_timestamp(
+        value: Any, ts_cache: Optional[Dict[str, datetime]] = None
+    ) -> Optional[datetime]:
+        """
+        Parse an ISO timestamp string as UTC, reusing results from ts_cache
+
+        Logs from the same batch frequently share identical timestamp strings,
+        so each distinct string is parsed only once per batch.
+
+        Args:
+            value: ISO format string or datetime object
+            ts_cache: Optional cache of parsed timestamps
+
+        Returns:
+            Parsed datetime (non-string values are returned unchanged)
+        """
+        if not isinstance(value, str):
+            return value
+        if ts_cache is None:
+            return from_iso_format(value, _UTC)
+        timestamp = ts_cache.get(value)
+        if timestamp is None:
+            timestamp = ts_cache[value] = from_iso_format(value, _UTC)
+        return timestamp
 
     @staticmethod
     def _convert_simple_message_to_raw_data(
-        message_data: Dict[str, Any], request_id: Optional[str] = None
+        message_data: Dict[str, Any],
+        request_id: Optional[str] = None,
+        ts_cache: Optional[Dict[str, datetime]] = None,
+        str_cache: Optional[Dict[str, str]] = None,
     ) -> Optional[RawData]:
         """
         Convert simple message format to RawData
@@ -86,6 +157,8 @@ class MemoryRequestLogMapper:
         Args:
             message_data: Dictionary containing simple message data
             request_id: Request ID (optional, used in metadata)
+            ts_cache: Optional cache of parsed timestamps
+            str_cache: Optional cache of repeated strings
 
         Returns:
             RawData object or None
@@ -105,10 +178,9 @@ class MemoryRequestLogMapper:
         timestamp = None
         if create_time_str:
             try:
-                if isinstance(create_time_str, str):
-                    timestamp = from_iso_format(create_time_str, ZoneInfo("UTC"))
-                else:
-                    timestamp = create_time_str
+                timestamp = MemoryRequestLogMapper._parse_timestamp(
+                    create_time_str, ts_cache
+                )
             except (ValueError, TypeError) as e:
                 logger.warning(
                     "Failed to parse create_time: %s, error: %s", create_time_str, e
@@ -118,30 +190,39 @@ class MemoryRequestLogMapper:
         refer_list = normalize_refer_list(message_data.get("refer_list", []))
 
         # Build extra_metadata
-        extra_metadata = {"request_id": request_id} if request_id else None
+        dedup = MemoryRequestLogMapper._dedup_str
+        extra_metadata = (
+            {"request_id": dedup(request_id, str_cache)} if request_id else None
+        )
 
         return build_raw_data_from_simple_message(
             message_id=message_id,
-            sender=sender,
+            sender=dedup(sender, str_cache),
             content=content,
             timestamp=timestamp,
-            sender_name=message_data.get("sender_name"),
-            role=message_data.get("role"),
-            group_id=message_data.get("group_id"),
-            group_name=message_data.get("group_name"),
+            sender_name=dedup(message_data.get("sender_name"), str_cache),
+            role=dedup(message_data.get("role"), str_cache),
+            group_id=dedup(message_data.get("group_id"), str_cache),
+            group_name=dedup(message_data.get("group_name"), str_cache),
             refer_list=refer_list,
             extra_metadata=extra_metadata,
         )
 
     @staticmethod
-    def _build_from_fields(log: MemoryRequestLog) -> RawData:
+    def _build_from_fields(
+        log: Union[MemoryRequestLog, MemoryRequestLogProjection],
+        ts_cache: Optional[Dict[str, datetime]] = None,
+        str_cache: Optional[Dict[str, str]] = None,
+    ) -> RawData:
         """
         Build RawData from individual fields of MemoryRequestLog
 
         Use the unified build_raw_data_from_simple_message function to ensure field consistency.
 
         Args:
-            log: MemoryRequestLog object
+            log: MemoryRequestLog (or MemoryRequestLogProjection) object
+            ts_cache: Optional cache of parsed timestamps
+            str_cache: Optional cache of repeated strings
 
         Returns:
             RawData object
@@ -151,12 +232,9 @@ class MemoryRequestLogMapper:
         if log.message_create_time:
             try:
                 # If it's a string, parse it into datetime
-                if isinstance(log.message_create_time, str):
-                    timestamp = from_iso_format(
-                        log.message_create_time, ZoneInfo("UTC")
-                    )
-                else:
-                    timestamp = log.message_create_time
+                timestamp = MemoryRequestLogMapper._parse_timestamp(
+                    log.message_create_time, ts_cache
+                )
             except (ValueError, TypeError) as e:
                 logger.warning(
                     "Failed to parse message_create_time: %s, error: %s",
@@ -166,35 +244,42 @@ class MemoryRequestLogMapper:
                 timestamp = None
 
         # Use unified build function
+        dedup = MemoryRequestLogMapper._dedup_str
         return build_raw_data_from_simple_message(
             message_id=log.message_id or str(log.id),
-            sender=log.sender or "",
+            sender=dedup(log.sender or "", str_cache),
             content=log.content or "",
             timestamp=timestamp,
-            sender_name=log.sender_name,
-            role=log.role,
-            group_id=log.group_id,
-            group_name=log.group_name,
+            sender_name=dedup(log.sender_name, str_cache),
+            role=dedup(log.role, str_cache),
+            group_id=dedup(log.group_id, str_cache),
+            group_name=dedup(log.group_name, str_cache),
             refer_list=log.refer_list or [],
-            extra_metadata={"request_id": log.request_id},
+            extra_metadata={"request_id": dedup(log.request_id, str_cache)},
         )
 
     @staticmethod
-    def to_raw_data_list(logs: List[MemoryRequestLog]) -> List[RawData]:
+    def to_raw_data_list(
+        logs: List[Union[MemoryRequestLog, MemoryRequestLogProjection]]
+    ) -> List[RawData]:
         """
         Batch convert a list of MemoryRequestLog objects to a list of RawData objects
 
         Args:
-            logs: List of MemoryRequestLog objects
+            logs: List of MemoryRequestLog (or MemoryRequestLogProjection) objects
 
         Returns:
             List of RawData objects (skip records that fail conversion)
         """
         raw_data_list: List[RawData] = []
+        # Logs in one batch often share timestamps, parse each distinct string once
+        ts_cache: Dict[str, datetime] = {}
+        # Group and sender strings repeat too, keep one shared instance of each
+        str_cache: Dict[str, str] = {}
 
         for log in logs:
             try:
-                raw_data = MemoryRequestLogMapper.to_raw_data(log)
+                raw_data = MemoryRequestLogMapper.to_raw_data(log, ts_cache, str_cache)
                 if raw_data:
                     raw_data_list.append(raw_data)
             except (ValueError, TypeError) as e:
@@ -10,7 +10,6 @@ from typing import List, Optional
 
 from core.observation.logger import get_logger
 from core.di.decorators import repository
-from core.di import get_bean
 from memory_layer.memcell_extractor.base_memcell_extractor import RawData
 from biz_layer.mem_db_operations import _normalize_datetime_for_storage
 from infra_layer.adapters.out.persistence.repository.memory_request_log_repository import (
@@ -19,6 +18,9 @@ from infra_layer.adapters.out.persistence.repository.memory_request_log_reposito
 from infra_layer.adapters.out.persistence.mapper.memory_request_log_mapper import (
     MemoryRequestLogMapper,
 )
+from infra_layer.adapters.out.persistence.document.request.memory_request_log import (
+    MemoryRequestLogProjection,
+)
 
 logger = get_logger(__name__)
 
@@ -91,6 +93,25 @@ class ConversationDataRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def restart_conversation_data(
+        self, raw_data_list: List[RawData], group_id: str
+    ) -> bool:
+        """
+        Mark accumulated data as used and start a new accumulation with raw_data_list
+
+        Same result as delete_conversation_data excluding the message_ids in
+        raw_data_list, followed by save_conversation_data(raw_data_list).
+
+        Args:
+            raw_data_list: RawData list that starts the next accumulation window
+            group_id: Group ID
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        pass
+
     @abstractmethod
     async def fetch_unprocessed_conversation_data(
         self, group_id: str, limit: int = 100
@@ -124,14 +145,14 @@ class ConversationDataRepositoryImpl(ConversationDataRepository):
     the RequestHistoryEvent listener.
     """
 
-    def __init__(self):
-        self._repo: Optional[MemoryRequestLogRepository] = None
+    def __init__(self, memory_request_log_repository: MemoryRequestLogRepository):
+        """
+        Initialize conversation data repository
 
-    def _get_repo(self) -> MemoryRequestLogRepository:
-        """Lazy load MemoryRequestLogRepository"""
-        if self._repo is None:
-            self._repo = get_bean("memory_request_log_repository")
-        return self._repo
+        Args:
+            memory_request_log_repository: MemoryRequestLog data repository
+        """
+        self._repo = memory_request_log_repository
 
     # ==================== ConversationDataRepository Interface Implementation ====================
 
@@ -163,10 +184,12 @@ class ConversationDataRepositoryImpl(ConversationDataRepository):
         )
 
         try:
-            repo = self._get_repo()
+            repo = self._repo
 
-            # Extract message_id list (filter out empty values)
-            message_ids = [r.data_id for r in (raw_data_list or []) if r.data_id]
+            # Extract deduplicated message_id list (filter out empty values)
+            message_ids = list(
+                dict.fromkeys(r.data_id for r in raw_data_list or () if r.data_id)
+            )
 
             if not message_ids:
                 logger.debug("No message_ids to confirm, skipping update")
@@ -177,7 +200,7 @@ class ConversationDataRepositoryImpl(ConversationDataRepository):
                 group_id, message_ids
             )
 
-            logger.info(
+            logger.debug(
                 "Window accumulation confirmation completed: group_id=%s, message_ids=%d, modified=%d",
                 group_id,
                 len(message_ids),
@@ -232,7 +255,7 @@ class ConversationDataRepositoryImpl(ConversationDataRepository):
         )
 
         try:
-            repo = self._get_repo()
+            repo = self._repo
 
             # Convert time format
             start_dt = (
@@ -248,12 +271,13 @@ class ConversationDataRepositoryImpl(ConversationDataRepository):
                 end_time=end_dt,
                 limit=limit,
                 exclude_message_ids=exclude_message_ids,
+                model=MemoryRequestLogProjection,
             )
 
             # Use mapper to convert to RawData list
             raw_data_list = MemoryRequestLogMapper.to_raw_data_list(logs)
 
-            logger.info(
+            logger.debug(
                 "Conversation data fetch completed: group_id=%s, count=%d",
                 group_id,
                 len(raw_data_list),
@@ -289,13 +313,13 @@ class ConversationDataRepositoryImpl(ConversationDataRepository):
         )
 
         try:
-            repo = self._get_repo()
+            repo = self._repo
             # Update sync_status: -1,0 -> 1
             modified_count = await repo.mark_as_used_by_group_id(
                 group_id, exclude_message_ids=exclude_message_ids
             )
 
-            logger.info(
+            logger.debug(
                 "Conversation data marked as used: group_id=%s, modified=%d",
                 group_id,
                 modified_count,
@@ -310,6 +334,58 @@ class ConversationDataRepositoryImpl(ConversationDataRepository):
             )
             return False
 
+    async def restart_conversation_data(
+        self, raw_data_list: List[RawData], group_id: str
+    ) -> bool:
+        """
+        Mark accumulated data as used and start a new accumulation with raw_data_list
+
+        Used when a boundary is detected: all pending (-1) and accumulating (0)
+        data becomes used (1), except the messages in raw_data_list which enter
+        the next accumulation window (0). Replaces a delete_conversation_data +
+        save_conversation_data pair with a single update.
+
+        Args:
+            raw_data_list: RawData list that starts the next accumulation window
+            group_id: Conversation group ID
+
+        Returns:
+            bool: True if operation succeeds, False otherwise
+        """
+        logger.info(
+            "Restarting conversation data accumulation: group_id=%s, data_count=%d",
+            group_id,
+            len(raw_data_list) if raw_data_list else 0,
+        )
+
+        try:
+            repo = self._repo
+
+            # Extract deduplicated message_id list (filter out empty values)
+            message_ids = list(
+                dict.fromkeys(r.data_id for r in raw_data_list or () if r.data_id)
+            )
+
+            modified_count = await repo.restart_accumulation_by_message_ids(
+                group_id, message_ids
+            )
+
+            logger.debug(
+                "Conversation data accumulation restarted: group_id=%s, message_ids=%d, modified=%d",
+                group_id,
+                len(message_ids),
+                modified_count,
+            )
+            return True
+
+        except Exception as e:
+            logger.error(
+                "Failed to restart conversation data accumulation: group_id=%s, error=%s",
+                group_id,
+                e,
+            )
+            return False
+
     async def fetch_unprocessed_conversation_data(
         self, group_id: str, limit: int = 100
     ) -> List[RawData]:
@@ -337,7 +413,7 @@ class ConversationDataRepositoryImpl(ConversationDataRepository):
         )
 
         try:
-            repo = self._get_repo()
+            repo = self._repo
 
             # Query both pending (-1) and accumulating (0) records
             # No time range filter, ascending order (oldest first)
@@ -348,12 +424,13 @@ class ConversationDataRepositoryImpl(ConversationDataRepository):
                 end_time=None,
                 limit=limit,
                 ascending=True,
+                model=MemoryRequestLogProjection,
             )
 
             # Use mapper to convert to RawData list
             raw_data_list = MemoryRequestLogMapper.to_raw_data_list(logs)
 
-            logger.info(
+            logger.debug(
                 "Unprocessed conversation data fetch completed: group_id=%s, count=%d",
                 group_id,
                 len(raw_data_list),
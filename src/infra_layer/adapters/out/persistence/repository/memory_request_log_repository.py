@@ -7,16 +7,26 @@ Used as a replacement for the conversation_data functionality.
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Type, TypeVar, Union
+from bson import ObjectId
 from pymongo.asynchronous.client_session import AsyncClientSession
+from pymongo.asynchronous.collection import AsyncCollection
+from pymongo.errors import BulkWriteError
+from pymongo.write_concern import WriteConcern
+from beanie.odm.utils.dump import get_dict
 from core.observation.logger import get_logger
 from core.di.decorators import repository
+from core.oxm.mongo.audit_base import AuditBase
 from core.oxm.mongo.base_repository import BaseRepository
 from core.oxm.constants import MAGIC_ALL
 from infra_layer.adapters.out.persistence.document.request.memory_request_log import (
     MemoryRequestLog,
+    MemoryRequestLogProjection,
 )
 
+# Define generic type variable
+T = TypeVar('T', MemoryRequestLog, MemoryRequestLogProjection)
+
 logger = get_logger(__name__)
 
 
@@ -31,6 +41,103 @@ class MemoryRequestLogRepository(BaseRepository[MemoryRequestLog]):
 
     def __init__(self):
         super().__init__(MemoryRequestLog)
+        self._pymongo_collection: Optional[AsyncCollection] = None
+
+    @property
+    def _collection(self) -> AsyncCollection:
+        """
+        pymongo collection of MemoryRequestLog, resolved once on first use
+
+        The repository may be created before Beanie is initialized, so the
+        handle cannot be fetched in __init__.
+        """
+        if self._pymongo_collection is None:
+            self._pymongo_collection = MemoryRequestLog.get_pymongo_collection()
+        return self._pymongo_collection
+
+    @staticmethod
+    def _build_keyset_filter(
+        after: Tuple[datetime, ObjectId], ascending: bool
+    ) -> Dict[str, Any]:
+        """
+        Build a keyset pagination filter on (created_at, _id)
+
+        Seeks directly past the last record of the previous page instead of
+        skipping over it, so each page costs O(limit) regardless of depth.
+
+        Args:
+            after: (created_at, _id) of the last record of the previous page
+            ascending: Sort direction of the paginated query
+
+        Returns:
+            Filter to merge into the query
+        """
+        after_time, after_id = after
+        op = "$gt" if ascending else "$lt"
+        return {
+            "$or": [
+                {"created_at": {op: after_time}},
+                {"created_at": after_time, "_id": {op: after_id}},
+            ]
+        }
+
+    @staticmethod
+    def _build_group_query(
+        group_id: str,
+        sync_status: Optional[int],
+        start_time: Optional[datetime],
+        end_time: Optional[datetime],
+    ) -> Dict[str, Any]:
+        """
+        Build the find_by_group_id / iter_by_group_id filter
+
+        Args:
+            group_id: Conversation group ID
+            sync_status: Sync status filter, None for no filter
+            start_time: Start time
+            end_time: End time
+
+        Returns:
+            Query filter
+        """
+        query = {"group_id": group_id}
+
+        # Filter by status
+        if sync_status is not None:
+            query["sync_status"] = sync_status
+
+        if start_time:
+            query["created_at"] = {"$gte": start_time}
+        if end_time:
+            if "created_at" in query:
+                query["created_at"]["$lte"] = end_time
+            else:
+                query["created_at"] = {"$lte": end_time}
+
+        return query
+
+    @staticmethod
+    def _encode_for_insert(
+        memory_request_logs: List[MemoryRequestLog],
+    ) -> List[Dict[str, Any]]:
+        """
+        Encode documents for a direct pymongo insert
+
+        Fills the audit timestamps (the part of Beanie's insert hooks these
+        documents rely on) and encodes each document the way Beanie does.
+
+        Args:
+            memory_request_logs: List of MemoryRequestLog objects
+
+        Returns:
+            List of BSON-ready dicts (without _id for documents that have none)
+        """
+        AuditBase.prepare_for_insert_many(memory_request_logs)
+        keep_nulls = MemoryRequestLog.get_settings().keep_nulls
+        return [
+            get_dict(log, to_db=True, keep_nulls=keep_nulls)
+            for log in memory_request_logs
+        ]
 
     # ==================== Save Methods ====================
 
@@ -50,7 +157,12 @@ class MemoryRequestLogRepository(BaseRepository[MemoryRequestLog]):
             Saved MemoryRequestLog or None
         """
         try:
-            await memory_request_log.insert(session=session)
+            # Logs are append-only and have no insert hooks besides the audit
+            # timestamps, so skip Beanie's action/state wrappers around insert
+            result = await self._collection.insert_one(
+                self._encode_for_insert([memory_request_log])[0], session=session
+            )
+            memory_request_log.id = result.inserted_id
             logger.debug(
                 "Memory request log saved successfully: id=%s, group_id=%s, request_id=%s",
                 memory_request_log.id,
@@ -62,6 +174,72 @@ class MemoryRequestLogRepository(BaseRepository[MemoryRequestLog]):
             logger.error("Failed to save Memory request log: %s", e)
             return None
 
+    async def save_many(
+        self,
+        memory_request_logs: List[MemoryRequestLog],
+        session: Optional[AsyncClientSession] = None,
+        write_concern: Optional[WriteConcern] = None,
+    ) -> List[MemoryRequestLog]:
+        """
+        Save multiple Memory request logs in one round-trip
+
+        Uses an unordered insert_many, so one failing document does not stop
+        the remaining inserts; only the documents that were stored are returned.
+
+        Args:
+            memory_request_logs: List of MemoryRequestLog objects
+            session: Optional MongoDB session
+            write_concern: Optional write concern overriding the collection
+                default, e.g. WriteConcern(w=1, j=False) to trade durability
+                for latency. Ignored inside a transaction, where the
+                transaction's write concern applies.
+
+        Returns:
+            List of saved MemoryRequestLog (with id set), empty on failure
+        """
+        if not memory_request_logs:
+            return []
+
+        try:
+            # Encode here rather than through Beanie so the _id pymongo assigns
+            # to each document is known even when part of the batch fails
+            documents = self._encode_for_insert(memory_request_logs)
+            collection = self._collection
+            if write_concern is not None and not (
+                session is not None and session.in_transaction
+            ):
+                collection = collection.with_options(write_concern=write_concern)
+
+            failed_indexes = set()
+            try:
+                await collection.insert_many(documents, ordered=False, session=session)
+            except BulkWriteError as e:
+                for write_error in e.details.get("writeErrors", []):
+                    index = write_error["index"]
+                    failed_indexes.add(index)
+                    logger.error(
+                        "Failed to save Memory request log: message_id=%s, error=%s",
+                        memory_request_logs[index].message_id,
+                        write_error.get("errmsg"),
+                    )
+
+            saved_logs = []
+            for index, (memory_request_log, document) in enumerate(
+                zip(memory_request_logs, documents)
+            ):
+                if index not in failed_indexes:
+                    memory_request_log.id = document["_id"]
+                    saved_logs.append(memory_request_log)
+            logger.debug(
+                "Memory request logs saved: saved=%d, failed=%d",
+                len(saved_logs),
+                len(failed_indexes),
+            )
+            return saved_logs
+        except Exception as e:
+            logger.error("Failed to save Memory request logs: %s", e)
+            return []
+
     # ==================== Query Methods ====================
 
     async def get_by_request_id(
@@ -94,7 +272,8 @@ class MemoryRequestLogRepository(BaseRepository[MemoryRequestLog]):
         limit: int = 100,
         sync_status: Optional[int] = 0,
         session: Optional[AsyncClientSession] = None,
-    ) -> List[MemoryRequestLog]:
+        model: Optional[Type[T]] = None,
+    ) -> List[Union[MemoryRequestLog, MemoryRequestLogProjection]]:
         """
         Query Memory request logs by group_id
 
@@ -109,31 +288,28 @@ class MemoryRequestLogRepository(BaseRepository[MemoryRequestLog]):
                 -  1: Already fully used
                 - None: No filter, return all statuses
             session: Optional MongoDB session
+            model: Returned model type, default is MemoryRequestLog (full version),
+                   can pass MemoryRequestLogProjection to fetch message fields only
 
         Returns:
-            List of MemoryRequestLog
+            List of MemoryRequestLog or MemoryRequestLogProjection
         """
         try:
-            query = {"group_id": group_id}
+            # If model is not specified, use full version
+            target_model = model if model is not None else self.model
 
-            # Filter by status
-            if sync_status is not None:
-                query["sync_status"] = sync_status
+            query = self._build_group_query(group_id, sync_status, start_time, end_time)
 
-            if start_time:
-                query["created_at"] = {"$gte": start_time}
-            if end_time:
-                if "created_at" in query:
-                    query["created_at"]["$lte"] = end_time
-                else:
-                    query["created_at"] = {"$lte": end_time}
+            # Determine whether to use projection based on model type
+            if target_model == self.model:
+                find_query = self.model.find(query, session=session)
+            else:
+                find_query = self.model.find(
+                    query, projection_model=target_model, session=session
+                )
 
-            results = (
-                await MemoryRequestLog.find(query, session=session)
-                .sort([("created_at", 1)])  # Ascending order by time, oldest first
-                .limit(limit)
-                .to_list()
-            )
+            # Ascending order by time, oldest first
+            results = await find_query.sort([("created_at", 1)]).limit(limit).to_list()
             logger.debug(
                 "Query Memory request logs by group_id: group_id=%s, sync_status=%s, count=%d",
                 group_id,
@@ -145,6 +321,146 @@ class MemoryRequestLogRepository(BaseRepository[MemoryRequestLog]):
             logger.error("Failed to query Memory request logs by group_id: %s", e)
             return []
 
+    async def iter_by_group_id(
+        self,
+        group_id: str,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        limit: int = 100,
+        sync_status: Optional[int] = 0,
+        batch_size: int = 50,
+        session: Optional[AsyncClientSession] = None,
+        model: Optional[Type[T]] = None,
+    ) -> AsyncIterator[Union[MemoryRequestLog, MemoryRequestLogProjection]]:
+        """
+        Stream Memory request logs by group_id
+
+        Same query and order as find_by_group_id, but documents are fetched in
+        batches of batch_size and yielded one at a time instead of being
+        materialized into a list, keeping memory flat for large windows.
+
+        Args:
+            group_id: Conversation group ID
+            start_time: Start time
+            end_time: End time
+            limit: Maximum number of records to return
+            sync_status: Sync status filter (default 0=in window accumulation, None=no filter)
+            batch_size: Number of documents fetched per cursor round-trip
+            session: Optional MongoDB session
+            model: Returned model type, default is MemoryRequestLog (full version),
+                   can pass MemoryRequestLogProjection to fetch message fields only
+
+        Yields:
+            MemoryRequestLog or MemoryRequestLogProjection
+        """
+        try:
+            target_model = model if model is not None else self.model
+            query = self._build_group_query(group_id, sync_status, start_time, end_time)
+
+            if target_model == self.model:
+                find_query = self.model.find(
+                    query, session=session, batch_size=batch_size
+                )
+            else:
+                find_query = self.model.find(
+                    query,
+                    projection_model=target_model,
+                    session=session,
+                    batch_size=batch_size,
+                )
+
+            # Ascending order by time, oldest first
+            async for log in find_query.sort([("created_at", 1)]).limit(limit):
+                yield log
+        except Exception as e:
+            logger.error("Failed to stream Memory request logs by group_id: %s", e)
+
+    async def find_ids_by_group_id(
+        self,
+        group_id: str,
+        sync_status: Optional[int] = 0,
+        limit: int = 100,
+        session: Optional[AsyncClientSession] = None,
+    ) -> List[Tuple[datetime, ObjectId]]:
+        """
+        Query (created_at, id) keys of Memory request logs by group_id
+
+        Reads the raw collection with an _id/created_at projection, skipping
+        Beanie document construction, for callers that only need record keys.
+        Each key can be passed as `after` to continue a keyset-paginated query.
+
+        Args:
+            group_id: Conversation group ID
+            sync_status: Sync status filter (default 0=in window accumulation, None=no filter)
+            limit: Maximum number of records to return
+            session: Optional MongoDB session
+
+        Returns:
+            List of (created_at, id), oldest first
+        """
+        try:
+            query = self._build_group_query(group_id, sync_status, None, None)
+            cursor = (
+                self._collection.find(
+                    query, {"_id": 1, "created_at": 1}, session=session
+                )
+                .sort([("created_at", 1), ("_id", 1)])
+                .limit(limit)
+            )
+            return [(doc.get("created_at"), doc["_id"]) async for doc in cursor]
+        except Exception as e:
+            logger.error("Failed to query Memory request log ids by group_id: %s", e)
+            return []
+
+    async def summarize_group(
+        self,
+        group_id: str,
+        sync_status: Optional[int] = 0,
+        session: Optional[AsyncClientSession] = None,
+    ) -> Dict[str, Any]:
+        """
+        Summarize Memory request logs of a group in one aggregation
+
+        Computes the record count and created_at range on the server instead of
+        fetching the records and folding them in Python.
+
+        Args:
+            group_id: Conversation group ID
+            sync_status: Sync status filter (default 0=in window accumulation, None=no filter)
+            session: Optional MongoDB session
+
+        Returns:
+            {"count": int, "first_created_at": datetime or None,
+             "last_created_at": datetime or None}, empty dict on failure
+        """
+        try:
+            pipeline = [
+                {"$match": self._build_group_query(group_id, sync_status, None, None)},
+                {
+                    "$group": {
+                        "_id": None,
+                        "count": {"$sum": 1},
+                        "first_created_at": {"$min": "$created_at"},
+                        "last_created_at": {"$max": "$created_at"},
+                    }
+                },
+            ]
+            cursor = await self._collection.aggregate(pipeline, session=session)
+            results = await cursor.to_list(length=1)
+
+            summary = {"count": 0, "first_created_at": None, "last_created_at": None}
+            if results:
+                summary.update(results[0])
+                summary.pop("_id", None)
+            return summary
+        except Exception as e:
+            logger.error(
+                "Failed to summarize Memory request logs: group_id=%s, error=%s",
+                group_id,
+                e,
+            )
+            return {}
+
     async def find_by_group_id_with_statuses(
         self,
         group_id: str,
@@ -155,7 +471,9 @@ class MemoryRequestLogRepository(BaseRepository[MemoryRequestLog]):
         ascending: bool = True,
         exclude_message_ids: Optional[List[str]] = None,
         session: Optional[AsyncClientSession] = None,
-    ) -> List[MemoryRequestLog]:
+        model: Optional[Type[T]] = None,
+        after: Optional[Tuple[datetime, ObjectId]] = None,
+    ) -> List[Union[MemoryRequestLog, MemoryRequestLogProjection]]:
         """
         Query Memory request logs by group_id with multiple sync_status values
 
@@ -176,11 +494,18 @@ class MemoryRequestLogRepository(BaseRepository[MemoryRequestLog]):
                        if False, sort descending (newest first)
             exclude_message_ids: Message IDs to exclude from results
             session: Optional MongoDB session
+            model: Returned model type, default is MemoryRequestLog (full version),
+                   can pass MemoryRequestLogProjection to fetch message fields only
+            after: Keyset cursor, (created_at, id) of the last record of the
+                   previous page; results continue after it in sort order
 
         Returns:
-            List of MemoryRequestLog
+            List of MemoryRequestLog or MemoryRequestLogProjection
         """
         try:
+            # If model is not specified, use full version
+            target_model = model if model is not None else self.model
+
             query = {"group_id": group_id}
 
             # Filter by multiple statuses
@@ -202,12 +527,24 @@ class MemoryRequestLogRepository(BaseRepository[MemoryRequestLog]):
             if exclude_message_ids:
                 query["message_id"] = {"$nin": exclude_message_ids}
 
+            # Continue after the previous page
+            if after is not None:
+                query.update(self._build_keyset_filter(after, ascending))
+
             # Determine sort order
             sort_order = 1 if ascending else -1
 
+            # Determine whether to use projection based on model type
+            if target_model == self.model:
+                find_query = self.model.find(query, session=session)
+            else:
+                find_query = self.model.find(
+                    query, projection_model=target_model, session=session
+                )
+
+            # _id breaks created_at ties so keyset pages are stable
             results = (
-                await MemoryRequestLog.find(query, session=session)
-                .sort([("created_at", sort_order)])
+                await find_query.sort([("created_at", sort_order), ("_id", sort_order)])
                 .limit(limit)
                 .to_list()
             )
@@ -273,9 +610,9 @@ class MemoryRequestLogRepository(BaseRepository[MemoryRequestLog]):
             Number of deleted records
         """
         try:
-            result = await MemoryRequestLog.find(
+            result = await self._collection.delete_many(
                 {"group_id": group_id}, session=session
-            ).delete()
+            )
             deleted_count = result.deleted_count if result else 0
             logger.info(
                 "Deleted Memory request logs: group_id=%s, deleted=%d",
@@ -297,6 +634,9 @@ class MemoryRequestLogRepository(BaseRepository[MemoryRequestLog]):
     #
     # - save_conversation_data: -1 -> 0 (confirm enters window accumulation)
     # - delete_conversation_data: 0 -> 1 (mark as fully used)
+    # - restart_conversation_data: both of the above in a single update
+    #
+    # Records marked as used (1) get used_at and expire via a TTL index
 
     async def confirm_accumulation_by_group_id(
         self, group_id: str, session: Optional[AsyncClientSession] = None
@@ -318,7 +658,7 @@ class MemoryRequestLogRepository(BaseRepository[MemoryRequestLog]):
             Number of updated records
         """
         try:
-            collection = MemoryRequestLog.get_pymongo_collection()
+            collection = self._collection
             result = await collection.update_many(
                 {"group_id": group_id, "sync_status": -1},
                 {"$set": {"sync_status": 0}},
@@ -365,7 +705,7 @@ class MemoryRequestLogRepository(BaseRepository[MemoryRequestLog]):
             return 0
 
         try:
-            collection = MemoryRequestLog.get_pymongo_collection()
+            collection = self._collection
             result = await collection.update_many(
                 {
                     "group_id": group_id,
@@ -414,7 +754,7 @@ class MemoryRequestLogRepository(BaseRepository[MemoryRequestLog]):
             Number of updated records
         """
         try:
-            collection = MemoryRequestLog.get_pymongo_collection()
+            collection = self._collection
             query = {"group_id": group_id, "sync_status": {"$in": [-1, 0]}}
 
             # Exclude specific message_ids
@@ -422,7 +762,9 @@ class MemoryRequestLogRepository(BaseRepository[MemoryRequestLog]):
                 query["message_id"] = {"$nin": exclude_message_ids}
 
             result = await collection.update_many(
-                query, {"$set": {"sync_status": 1}}, session=session
+                query,
+                {"$set": {"sync_status": 1}, "$currentDate": {"used_at": True}},
+                session=session,
             )
             modified_count = result.modified_count if result else 0
             logger.info(
@@ -436,6 +778,67 @@ class MemoryRequestLogRepository(BaseRepository[MemoryRequestLog]):
             logger.error("Failed to mark as used: group_id=%s, error=%s", group_id, e)
             return 0
 
+    async def restart_accumulation_by_message_ids(
+        self,
+        group_id: str,
+        message_ids: List[str],
+        session: Optional[AsyncClientSession] = None,
+    ) -> int:
+        """
+        Mark pending and accumulating data as used, except message_ids which start the next accumulation
+
+        Equivalent to mark_as_used_by_group_id(exclude_message_ids=message_ids)
+        followed by confirm_accumulation_by_message_ids(message_ids), but done in
+        one round-trip with a pipeline update:
+        - sync_status -1/0 -> 1 for records not in message_ids
+        - sync_status -1 -> 0 for records in message_ids (0 stays 0)
+
+        Args:
+            group_id: Conversation group ID
+            message_ids: Message IDs that start the next accumulation window
+            session: Optional MongoDB session
+
+        Returns:
+            Number of updated records
+        """
+        try:
+            collection = self._collection
+            result = await collection.update_many(
+                {"group_id": group_id, "sync_status": {"$in": [-1, 0]}},
+                [
+                    {
+                        "$set": {
+                            "sync_status": {
+                                "$cond": [{"$in": ["$message_id", message_ids]}, 0, 1]
+                            },
+                            "used_at": {
+                                "$cond": [
+                                    {"$in": ["$message_id", message_ids]},
+                                    "$used_at",
+                                    "$$NOW",
+                                ]
+                            },
+                        }
+                    }
+                ],
+                session=session,
+            )
+            modified_count = result.modified_count if result else 0
+            logger.info(
+                "Restarted window accumulation: group_id=%s, message_ids=%d, modified=%d",
+                group_id,
+                len(message_ids),
+                modified_count,
+            )
+            return modified_count
+        except Exception as e:
+            logger.error(
+                "Failed to restart window accumulation: group_id=%s, error=%s",
+                group_id,
+                e,
+            )
+            return 0
+
     # ==================== Flexible Query Methods ====================
 
     async def find_pending_by_filters(
@@ -449,6 +852,7 @@ class MemoryRequestLogRepository(BaseRepository[MemoryRequestLog]):
         skip: int = 0,
         ascending: bool = True,
         session: Optional[AsyncClientSession] = None,
+        after: Optional[Tuple[datetime, ObjectId]] = None,
     ) -> List[MemoryRequestLog]:
         """
         Query pending Memory request logs by flexible filters
@@ -475,10 +879,12 @@ class MemoryRequestLogRepository(BaseRepository[MemoryRequestLog]):
             start_time: Start time (optional)
             end_time: End time (optional)
             limit: Maximum number of records to return
-            skip: Number of records to skip
+            skip: Number of records to skip (prefer `after` for deep pages)
             ascending: If True (default), sort by created_at ascending (oldest first);
                        if False, sort descending (newest first)
             session: Optional MongoDB session
+            after: Keyset cursor, (created_at, id) of the last record of the
+                   previous page; results continue after it in sort order
 
         Returns:
             List of MemoryRequestLog
@@ -522,12 +928,17 @@ class MemoryRequestLogRepository(BaseRepository[MemoryRequestLog]):
                     time_filter["$lte"] = end_time
                 query["created_at"] = time_filter
 
+            # Continue after the previous page
+            if after is not None:
+                query.update(self._build_keyset_filter(after, ascending))
+
             # Determine sort order
             sort_order = 1 if ascending else -1
 
+            # _id breaks created_at ties so keyset pages are stable
             results = (
                 await MemoryRequestLog.find(query, session=session)
-                .sort([("created_at", sort_order)])
+                .sort([("created_at", sort_order), ("_id", sort_order)])
                 .skip(skip)
                 .limit(limit)
                 .to_list()
@@ -0,0 +1,59 @@
+"""
+Drop Replaced Memory Request Log Indexes
+
+Beanie only creates the indexes declared on MemoryRequestLog and never drops
+the ones that were removed from it, so indexes replaced by a compound index
+stay on existing collections and are still written on every insert.
+
+Created at: 2026-10-15T10:00:00+08:00
+"""
+
+from beanie import free_fall_migration
+from pymongo import IndexModel, ASCENDING, DESCENDING
+
+from infra_layer.adapters.out.persistence.document.request.memory_request_log import (
+    MemoryRequestLog,
+)
+
+# Indexes replaced by the compound indexes now declared on MemoryRequestLog
+REPLACED_INDEXES = [
+    # Prefix of (group_id, sync_status, created_at, _id)
+    IndexModel(
+        [("group_id", ASCENDING), ("sync_status", ASCENDING)],
+        name="group_id_1_sync_status_1",
+    ),
+    # No query filters or sorts on message_create_time
+    IndexModel(
+        [("group_id", ASCENDING), ("message_create_time", DESCENDING)],
+        name="group_id_1_message_create_time_-1",
+    ),
+    # Prefix of (user_id, created_at, _id)
+    IndexModel([("user_id", ASCENDING)], name="user_id_1"),
+    # Prefix of (created_at, _id)
+    IndexModel([("created_at", DESCENDING)], name="created_at_-1"),
+]
+
+
+class Forward:
+    """Forward migration"""
+
+    @free_fall_migration(document_models=[MemoryRequestLog])
+    async def drop_replaced_indexes(self, session):
+        # Index commands cannot run in a multi-document transaction, so the
+        # migration session is not passed to them
+        collection = MemoryRequestLog.get_pymongo_collection()
+        existing = await collection.index_information()
+        for index in REPLACED_INDEXES:
+            name = index.document["name"]
+            # Collections created after the change never had the index
+            if name in existing:
+                await collection.drop_index(name)
+
+
+class Backward:
+    """Backward migration"""
+
+    @free_fall_migration(document_models=[MemoryRequestLog])
+    async def recreate_replaced_indexes(self, session):
+        collection = MemoryRequestLog.get_pymongo_collection()
+        await collection.create_indexes(REPLACED_INDEXES)
@@ -0,0 +1,39 @@
+"""
+Backfill Memory Request Log used_at
+
+The used_at TTL index only expires records that carry used_at, so records
+marked as used (sync_status=1) before the field existed would be kept forever.
+They get the migration time, which starts their retention now instead of
+deleting the whole backlog at once.
+
+Created at: 2026-10-15T11:00:00+08:00
+"""
+
+from beanie import free_fall_migration
+
+from infra_layer.adapters.out.persistence.document.request.memory_request_log import (
+    MemoryRequestLog,
+)
+
+
+class Forward:
+    """Forward migration"""
+
+    @free_fall_migration(document_models=[MemoryRequestLog])
+    async def backfill_used_at(self, session):
+        collection = MemoryRequestLog.get_pymongo_collection()
+        await collection.update_many(
+            {"sync_status": 1, "used_at": None},
+            {"$currentDate": {"used_at": True}},
+            session=session,
+        )
+
+
+class Backward:
+    """Backward migration"""
+
+    @free_fall_migration(document_models=[MemoryRequestLog])
+    async def keep_used_at(self, session):
+        # Records written after the field was added carry used_at as well and
+        # cannot be told apart from backfilled ones, so nothing is undone
+        pass
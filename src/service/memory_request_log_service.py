@@ -6,7 +6,6 @@ Directly extract data from MemorizeRequest and save to MemoryRequestLog,
 replacing the original event listener approach to make timing more controllable.
 """
 
-import json
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
@@ -66,7 +65,7 @@ class MemoryRequestLogService:
             endpoint_name: Endpoint name (optional)
             method: HTTP method (optional)
             url: Request URL (optional)
-            raw_input_dict: Raw input dictionary (optional, used to generate raw_input_str)
+            raw_input_dict: Raw input dictionary (optional, stored as raw_input)
 
         Returns:
             List[str]: List of saved message_ids
@@ -79,17 +78,14 @@ class MemoryRequestLogService:
         app_info = get_current_app_info()
         request_id = app_info.get("request_id", "unknown")
 
-        saved_message_ids = []
-        repo = self._get_repository()
-
+        memory_request_logs: List[MemoryRequestLog] = []
         for raw_data in request.new_raw_data_list:
             try:
-                message_id = await self._save_single_raw_data(
+                memory_request_log = self._build_request_log(
                     raw_data=raw_data,
                     group_id=request.group_id,
                     group_name=request.group_name,
                     request_id=request_id,
-                    repo=repo,
                     version=version,
                     endpoint_name=endpoint_name,
                     method=method,
@@ -97,15 +93,19 @@ class MemoryRequestLogService:
                     event_id=request_id,  # Use request_id as event_id
                     raw_input_dict=raw_input_dict,
                 )
-                if message_id:
-                    saved_message_ids.append(message_id)
+                if memory_request_log:
+                    memory_request_logs.append(memory_request_log)
             except Exception as e:
                 logger.error(
-                    "Failed to save RawData to MemoryRequestLog: data_id=%s, error=%s",
+                    "Failed to build MemoryRequestLog from RawData: data_id=%s, error=%s",
                     raw_data.data_id,
                     e,
                 )
 
+        # Save all messages of the request in one round-trip
+        saved_logs = await self._get_repository().save_many(memory_request_logs)
+        saved_message_ids = [log.message_id for log in saved_logs if log.message_id]
+
         logger.info(
             "Saved %d request logs: group_id=%s, message_ids=%s",
             len(saved_message_ids),
@@ -115,38 +115,36 @@ class MemoryRequestLogService:
 
         return saved_message_ids
 
-    async def _save_single_raw_data(
+    def _build_request_log(
         self,
         raw_data: RawData,
         group_id: Optional[str],
         group_name: Optional[str],
         request_id: str,
-        repo: MemoryRequestLogRepository,
         version: Optional[str] = None,
         endpoint_name: Optional[str] = None,
         method: Optional[str] = None,
         url: Optional[str] = None,
         event_id: Optional[str] = None,
         raw_input_dict: Optional[Dict[str, Any]] = None,
-    ) -> Optional[str]:
+    ) -> Optional[MemoryRequestLog]:
         """
-        Save a single RawData to MemoryRequestLog
+        Build a MemoryRequestLog from a single RawData
 
         Args:
             raw_data: RawData object
             group_id: Group ID
             group_name: Group name
             request_id: Request ID
-            repo: Repository instance
             version: API version
             endpoint_name: Endpoint name
             method: HTTP method
             url: Request URL
             event_id: Event ID
-            raw_input_dict: Raw input dictionary (used to generate raw_input_str)
+            raw_input_dict: Raw input dictionary (stored as raw_input)
 
         Returns:
-            Optional[str]: Returns message_id if saved successfully, None otherwise
+            Optional[MemoryRequestLog]: Unsaved document, None if group_id is empty
         """
         if not group_id:
             logger.debug("group_id is empty, skipping save")
@@ -184,14 +182,6 @@ class MemoryRequestLogService:
         # Support multiple refer list field names
         refer_list = content_dict.get("referList") or content_dict.get("refer_list")
 
-        # Generate raw_input_str
-        raw_input_str = None
-        if raw_input_dict:
-            try:
-                raw_input_str = json.dumps(raw_input_dict, ensure_ascii=False)
-            except (TypeError, ValueError):
-                pass
-
         # Create MemoryRequestLog document
         memory_request_log = MemoryRequestLog(
             # Core identifier fields
@@ -207,9 +197,8 @@ class MemoryRequestLogService:
             content=content,
             group_name=group_name,
             refer_list=self._normalize_refer_list(refer_list),
-            # Raw input
+            # Raw input (raw_input_str is no longer written, it duplicated raw_input)
             raw_input=raw_input_dict or content_dict,
-            raw_input_str=raw_input_str,
             # Request metadata
             version=version,
             endpoint_name=endpoint_name,
@@ -220,17 +209,14 @@ class MemoryRequestLogService:
             # sync_status=-1 indicates a newly saved log record
         )
 
-        # Save to MongoDB
-        await repo.save(memory_request_log)
-
         logger.debug(
-            "Saved request log: group_id=%s, message_id=%s, content_preview=%s",
+            "Built request log: group_id=%s, message_id=%s, content_preview=%s",
             group_id,
             message_id,
             (content or "")[:50],
         )
 
-        return message_id
+        return memory_request_log
 
     def _parse_create_time(self, create_time: Any) -> Optional[str]:
         """Parse creation time and return ISO format string"""
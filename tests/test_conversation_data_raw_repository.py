@@ -9,11 +9,15 @@ Test contents include:
 3. delete_conversation_data (marks sync_status=-1 and 0 as used -> 1)
 4. fetch_unprocessed_conversation_data
 5. sync_status state transitions
+6. restart_conversation_data (marks history as used, confirms new message_ids -> 0)
+7. keyset paging (after) with tied created_at values
+8. iter_by_group_id (streams the find_by_group_id result in batches)
+9. summarize_group (count and created_at range, empty and populated group)
 """
 
 import asyncio
 import uuid
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import List
 
 from core.di import get_bean_by_type
@@ -26,6 +30,7 @@ from infra_layer.adapters.out.persistence.repository.memory_request_log_reposito
 )
 from infra_layer.adapters.out.persistence.document.request.memory_request_log import (
     MemoryRequestLog,
+    MemoryRequestLogProjection,
 )
 from memory_layer.memcell_extractor.base_memcell_extractor import RawData
 from core.observation.logger import get_logger
@@ -317,6 +322,8 @@ async def test_delete_conversation_data():
         assert len(logs) == 2
         used_count = sum(1 for log in logs if log.sync_status == 1)
         assert used_count == 2, f"Expected 2 used records, got {used_count}"
+        # used_at drives the TTL index, without it used records never expire
+        assert all(log.used_at is not None for log in logs), "used_at must be set"
         logger.info("✅ Both sync_status=-1 and 0 were marked as used (1)")
 
         # Verify get_conversation_data returns empty (no -1 or 0 left)
@@ -397,6 +404,75 @@ async def test_delete_conversation_data_with_exclude():
     logger.info("✅ delete_conversation_data with exclude test completed")
 
 
+async def test_restart_conversation_data():
+    """Test restart_conversation_data marks history as used and confirms new messages"""
+    logger.info("Starting test for restart_conversation_data...")
+
+    repo = get_bean_by_type(ConversationDataRepository)
+    group_id = generate_unique_id("test_restart_")
+
+    try:
+        # History: msg1 pending, msg2 accumulating; new request: msg3 pending
+        msg1_id = generate_unique_id("msg_")
+        msg2_id = generate_unique_id("msg_")
+        msg3_id = generate_unique_id("msg_")
+
+        await create_test_memory_request_log(
+            group_id=group_id, message_id=msg1_id, content="Message 1", sync_status=-1
+        )
+        await create_test_memory_request_log(
+            group_id=group_id, message_id=msg2_id, content="Message 2", sync_status=0
+        )
+        await create_test_memory_request_log(
+            group_id=group_id, message_id=msg3_id, content="Message 3", sync_status=-1
+        )
+        logger.info("✅ Created 3 logs")
+
+        # Duplicate data_id must not matter
+        raw_data_list = [
+            RawData(
+                data_id=msg3_id, content={"content": "Message 3"}, data_type="message"
+            ),
+            RawData(
+                data_id=msg3_id, content={"content": "Message 3"}, data_type="message"
+            ),
+        ]
+        result = await repo.restart_conversation_data(raw_data_list, group_id)
+        assert result is True
+        logger.info("✅ restart_conversation_data returned True")
+
+        # Verify: msg1 and msg2 are now 1, msg3 entered accumulation (0)
+        logs = await get_logs_by_group_id(group_id)
+        assert len(logs) == 3
+
+        for log in logs:
+            if log.message_id == msg3_id:
+                assert (
+                    log.sync_status == 0
+                ), f"msg3 should be confirmed to 0, got {log.sync_status}"
+                assert log.used_at is None, "msg3 is not used, used_at must stay unset"
+            else:
+                assert (
+                    log.sync_status == 1
+                ), f"Other msgs should be 1, got {log.sync_status}"
+                assert log.used_at is not None, "Used msgs must get used_at"
+
+        logger.info("✅ History marked as used, new message confirmed")
+
+        remaining = await repo.get_conversation_data(group_id)
+        assert len(remaining) == 1, f"Expected 1 result, got {len(remaining)}"
+        assert remaining[0].data_id == msg3_id
+
+    except Exception as e:
+        logger.error("❌ Test for restart_conversation_data failed: %s", e)
+        raise
+    finally:
+        await cleanup_test_data(group_id)
+        logger.info("✅ Cleaned up test data")
+
+    logger.info("✅ restart_conversation_data test completed")
+
+
 async def test_fetch_unprocessed_conversation_data():
     """Test fetch_unprocessed_conversation_data"""
     logger.info("Starting test for fetch_unprocessed_conversation_data...")
@@ -475,6 +551,188 @@ async def test_fetch_unprocessed_conversation_data():
     logger.info("✅ fetch_unprocessed_conversation_data test completed")
 
 
+async def test_keyset_paging_with_tied_created_at():
+    """Test keyset paging (after) returns every record once when created_at ties"""
+    logger.info("Starting test for keyset paging with tied created_at...")
+
+    log_repo = get_bean_by_type(MemoryRequestLogRepository)
+    group_id = generate_unique_id("test_keyset_")
+
+    try:
+        # 5 records sharing one created_at, so only _id orders them
+        tied_time = get_now_with_timezone().replace(microsecond=0)
+        message_ids = set()
+        for i in range(5):
+            message_id = generate_unique_id("msg_")
+            message_ids.add(message_id)
+            await create_test_memory_request_log(
+                group_id=group_id,
+                message_id=message_id,
+                content=f"Message {i}",
+                sync_status=-1,
+                created_at=tied_time,
+            )
+        logger.info("✅ Created 5 logs with the same created_at")
+
+        for ascending in (True, False):
+            seen = []
+            after = None
+            while True:
+                page = await log_repo.find_by_group_id_with_statuses(
+                    group_id=group_id,
+                    sync_status_list=[-1, 0],
+                    limit=2,
+                    ascending=ascending,
+                    after=after,
+                )
+                if not page:
+                    break
+                assert len(page) <= 2
+                seen.extend(log.message_id for log in page)
+                after = (page[-1].created_at, page[-1].id)
+
+            assert len(seen) == 5, f"Expected 5 records, got {len(seen)}"
+            assert set(seen) == message_ids, "Pages must cover every record once"
+            logger.info("✅ Paged through all records (ascending=%s)", ascending)
+
+        # Keys from find_ids_by_group_id continue the same ascending paging
+        keys = await log_repo.find_ids_by_group_id(group_id, sync_status=-1, limit=2)
+        first_page = await log_repo.find_by_group_id_with_statuses(
+            group_id=group_id, sync_status_list=[-1], limit=2, ascending=True
+        )
+        assert [key[1] for key in keys] == [log.id for log in first_page]
+        rest = await log_repo.find_by_group_id_with_statuses(
+            group_id=group_id,
+            sync_status_list=[-1],
+            limit=5,
+            ascending=True,
+            after=keys[-1],
+        )
+        assert len(rest) == 3, f"Expected 3 remaining records, got {len(rest)}"
+        assert not {key[1] for key in keys} & {log.id for log in rest}
+        logger.info("✅ find_ids_by_group_id keys work as after")
+
+    except Exception as e:
+        logger.error("❌ Test for keyset paging with tied created_at failed: %s", e)
+        raise
+    finally:
+        await cleanup_test_data(group_id)
+        logger.info("✅ Cleaned up test data")
+
+    logger.info("✅ Keyset paging with tied created_at test completed")
+
+
+async def test_iter_by_group_id():
+    """Test iter_by_group_id yields the same records as find_by_group_id"""
+    logger.info("Starting test for iter_by_group_id...")
+
+    log_repo = get_bean_by_type(MemoryRequestLogRepository)
+    group_id = generate_unique_id("test_iter_")
+
+    try:
+        base_time = get_now_with_timezone() - timedelta(minutes=10)
+        for i in range(5):
+            await create_test_memory_request_log(
+                group_id=group_id,
+                message_id=generate_unique_id("msg_"),
+                content=f"Message {i}",
+                sync_status=0,
+                created_at=base_time + timedelta(minutes=i),
+            )
+        logger.info("✅ Created 5 logs in window accumulation")
+
+        expected = await log_repo.find_by_group_id(group_id, limit=4)
+
+        # batch_size below limit, so the cursor needs several round-trips
+        streamed = [
+            log
+            async for log in log_repo.iter_by_group_id(group_id, limit=4, batch_size=2)
+        ]
+        assert [log.id for log in streamed] == [
+            log.id for log in expected
+        ], "Streamed records must match find_by_group_id, oldest first"
+        assert len(streamed) == 4, f"Expected 4 records, got {len(streamed)}"
+        logger.info("✅ Streamed records match find_by_group_id")
+
+        projected = [
+            log
+            async for log in log_repo.iter_by_group_id(
+                group_id, limit=4, model=MemoryRequestLogProjection
+            )
+        ]
+        assert all(isinstance(log, MemoryRequestLogProjection) for log in projected)
+        assert [log.message_id for log in projected] == [
+            log.message_id for log in expected
+        ]
+        logger.info("✅ Projection model is streamed too")
+
+    except Exception as e:
+        logger.error("❌ Test for iter_by_group_id failed: %s", e)
+        raise
+    finally:
+        await cleanup_test_data(group_id)
+        logger.info("✅ Cleaned up test data")
+
+    logger.info("✅ iter_by_group_id test completed")
+
+
+async def test_summarize_group():
+    """Test summarize_group count and created_at range"""
+    logger.info("Starting test for summarize_group...")
+
+    log_repo = get_bean_by_type(MemoryRequestLogRepository)
+    group_id = generate_unique_id("test_summary_")
+
+    try:
+        summary = await log_repo.summarize_group(group_id)
+        assert summary == {
+            "count": 0,
+            "first_created_at": None,
+            "last_created_at": None,
+        }, f"Unexpected summary for an empty group: {summary}"
+        logger.info("✅ Empty group summarized as count 0 without bounds")
+
+        base_time = get_now_with_timezone() - timedelta(minutes=10)
+        for i in range(3):
+            await create_test_memory_request_log(
+                group_id=group_id,
+                message_id=generate_unique_id("msg_"),
+                content=f"Message {i}",
+                sync_status=0,
+                created_at=base_time + timedelta(minutes=i),
+            )
+        # Not in window accumulation, must not be counted
+        await create_test_memory_request_log(
+            group_id=group_id,
+            message_id=generate_unique_id("msg_"),
+            content="Pending message",
+            sync_status=-1,
+            created_at=base_time + timedelta(minutes=5),
+        )
+        logger.info("✅ Created 3 accumulating logs and 1 pending log")
+
+        # Read back the stored values, MongoDB keeps millisecond precision
+        logs = await log_repo.find_by_group_id(group_id)
+        summary = await log_repo.summarize_group(group_id)
+        assert "_id" not in summary, "Group key must not leak into the summary"
+        assert summary["count"] == 3, f"Expected 3 records, got {summary['count']}"
+        # The aggregation returns naive UTC datetimes, compare them as aware ones
+        first = summary["first_created_at"].replace(tzinfo=timezone.utc)
+        last = summary["last_created_at"].replace(tzinfo=timezone.utc)
+        assert first == logs[0].created_at, f"Unexpected first_created_at: {first}"
+        assert last == logs[-1].created_at, f"Unexpected last_created_at: {last}"
+        logger.info("✅ Populated group summarized with the created_at range")
+
+    except Exception as e:
+        logger.error("❌ Test for summarize_group failed: %s", e)
+        raise
+    finally:
+        await cleanup_test_data(group_id)
+        logger.info("✅ Cleaned up test data")
+
+    logger.info("✅ summarize_group test completed")
+
+
 async def test_sync_status_state_transitions():
     """Test the complete sync_status state transition flow"""
     logger.info("Starting test for sync_status state transitions...")
@@ -648,7 +906,11 @@ async def run_all_tests():
         await test_get_conversation_data()
         await test_delete_conversation_data()
         await test_delete_conversation_data_with_exclude()
+        await test_restart_conversation_data()
         await test_fetch_unprocessed_conversation_data()
+        await test_keyset_paging_with_tied_created_at()
+        await test_iter_by_group_id()
+        await test_summarize_group()
         await test_sync_status_state_transitions()
         await test_empty_raw_data_list()
         await test_raw_data_list_without_data_id()